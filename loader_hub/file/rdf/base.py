@@ -1,11 +1,45 @@
 """Read RDF files."""
 
+import io
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+_VOCAB_DIR = Path(__file__).parent
+_GLOBAL_GRAPH: Optional[Any] = None
+_GLOBAL_GRAPH_LOCK = threading.Lock()
+
+
+def _get_global_graph() -> Any:
+    """Get the graph of the RDF and RDFS vocabularies, parsing it on first use."""
+    global _GLOBAL_GRAPH
+
+    if _GLOBAL_GRAPH is None:
+        with _GLOBAL_GRAPH_LOCK:
+            if _GLOBAL_GRAPH is None:
+                from rdflib import Graph
+
+                g_global = Graph()
+                for vocab in ("rdf_vocab.ttl", "rdfs_vocab.ttl"):
+                    g_global.parse(source=str(_VOCAB_DIR / vocab), format="turtle")
+                _GLOBAL_GRAPH = g_global
+    return _GLOBAL_GRAPH
+
+
+def _fetch_label(
+    labels: Dict[Tuple[Any, Optional[str]], str], uri: Any, lang: str
+) -> str:
+    """Fetch the label of a URI by language, falling back to an untagged one."""
+    label = labels.get((uri, lang))
+    if label is None:
+        label = labels.get((uri, None))
+    if label is None:
+        raise Exception(f"Label not found for: {uri}")
+    return label
+
 
 class RDFReader(BaseReader):
     """RDF reader."""
@@ -21,52 +55,98 @@ class RDFReader(BaseReader):
         from rdflib import Graph, URIRef
         from rdflib.namespace import RDF, RDFS
 
-    def fetch_labels(self, uri: Any, graph: Any, lang: str):
-        """Fetch all labels of a URI by language."""
-
-        return list(
-            filter(lambda x: x.language in [lang, None], graph.objects(uri, RDFS.label))
-        )
-
     def fetch_label_in_graphs(self, uri: Any, lang: str = "en"):
-        """Fetch one label of a URI by language from the local or global graph."""
-
-        labels = self.fetch_labels(uri, self.g_local, lang)
-        if len(labels) > 0:
-            return labels[0].value
-
-        labels = self.fetch_labels(uri, self.g_global, lang)
-        if len(labels) > 0:
-            return labels[0].value
-
-        raise Exception(f"Label not found for: {uri}")
+        """Fetch one label of a URI by language from the last loaded graphs."""
+
+        return _fetch_label(self._labels, uri, lang)
+
+    def _index_labels(
+        self, g_local: Any, g_global: Any
+    ) -> Dict[Tuple[Any, Optional[str]], str]:
+        """Index the labels of the local and global graphs by URI and language."""
+        from rdflib.namespace import RDFS
+
+        # Labels found in the local graph take precedence over the global ones.
+        labels: Dict[Tuple[Any, Optional[str]], str] = {}
+        for graph in (g_local, g_global):
+            for s, o in graph.subject_objects(RDFS.label):
+                labels.setdefault((s, o.language), o.value)
+        return labels
+
+    def _parse_graph(
+        self, file: Path, extra_info: Dict, format: Optional[str]
+    ) -> Tuple[Any, Dict[Tuple[Any, Optional[str]], str]]:
+        """Parse file into a local graph, and index its labels."""
+        from rdflib import Graph
+        from rdflib.util import guess_format
+
+        format = format or extra_info.get("format") or guess_format(str(file))
+
+        g_local = Graph()
+        g_local.parse(file, format=format)
+
+        # Subjects and predicates repeat across triples, so index all labels
+        # once instead of querying the graphs for every term.
+        return g_local, self._index_labels(g_local, _get_global_graph())
+
+    def _labelled_triples(
+        self, g_local: Any, labels: Dict[Tuple[Any, Optional[str]], str], lang: str
+    ) -> Iterator[str]:
+        """Yield the triples of the local graph, with labels as terms."""
+        from rdflib.namespace import RDFS
+
+        # Plain Python iteration over the in-memory store is much cheaper than
+        # running the label join through rdflib's (pure Python) SPARQL engine.
+        # Walking the store predicate by predicate lets its predicate index
+        # skip the rdfs:label triples, and resolves each predicate's label once.
+        # The store yields the predicates from a set, so sort them to keep the
+        # output independent of the hash seed.
+        for p in sorted(set(g_local.predicates()) - {RDFS.label}, key=str):
+            p_label = _fetch_label(labels, p, lang)
+            for s, o in g_local.subject_objects(p):
+                yield (
+                    f"<{_fetch_label(labels, s, lang)}> "
+                    f"<{p_label}> "
+                    f"<{_fetch_label(labels, o, lang)}>"
+                )
+
+    def iter_triples(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        format: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Parse file and yield its triples one at a time, with labels as terms.
+
+        The RDF serialization is read from `format`, then `extra_info["format"]`,
+        and otherwise guessed from the file extension. Passing it skips rdflib's
+        guessing, e.g. "nt" selects the fast streaming N-Triples parser.
+        """
+        extra_info = extra_info or {}
+        g_local, labels = self._parse_graph(file, extra_info, format)
+        yield from self._labelled_triples(g_local, labels, extra_info.get("lang", "en"))
 
     def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        format: Optional[str] = None,
     ) -> List[Document]:
-        """Parse file."""
-
-        lang = extra_info["lang"] if extra_info is not None else "en"
-
-        self.g_local = Graph()
-        self.g_local.parse(file)
-
-        self.g_global = Graph()
-        self.g_global.parse(str(RDF))
-        self.g_global.parse(str(RDFS))
-
-        text_list = []
-
-        for s, p, o in self.g_local:
-            if p == RDFS.label:
-                continue
-            triple = (
-                f"<{self.fetch_label_in_graphs(s, lang=lang)}> "
-                f"<{self.fetch_label_in_graphs(p, lang=lang)}> "
-                f"<{self.fetch_label_in_graphs(o, lang=lang)}>"
-            )
-            text_list.append(triple)
-
-        text = "\n".join(text_list)
-
-        return [Document(text, extra_info=extra_info)]
+        """Parse file, see `iter_triples` for the `format` argument."""
+
+        lang = (extra_info or {}).get("lang", "en")
+        g_local, labels = self._parse_graph(file, extra_info or {}, format)
+        # Kept on the reader for fetch_label_in_graphs.
+        self.g_local = g_local
+        self.g_global = _get_global_graph()
+        self._labels = labels
+
+        buf = io.StringIO()
+        sep = ""
+        for triple in self._labelled_triples(g_local, labels, lang):
+            buf.write(sep)
+            buf.write(triple)
+            sep = "\n"
+
+        return [Document(buf.getvalue(), extra_info=extra_info)]
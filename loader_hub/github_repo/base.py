@@ -6,34 +6,49 @@ The documents are either the contents of the files in the repository or
 the text extracted from the files using the parser.
 """
 import asyncio
-import base64
 import binascii
+import concurrent.futures
 import enum
 import logging
 import os
 import pathlib
 import tempfile
-from typing import Any, Callable, List, Optional, Tuple
+import threading
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.file.base import DEFAULT_FILE_EXTRACTOR
 from llama_index.readers.llamahub_modules.github_repo.github_client import (
     BaseGithubClient,
+    GitBlobResponseModel,
     GitBranchResponseModel,
     GitCommitResponseModel,
     GithubClient,
     GitTreeResponseModel,
 )
 from llama_index.readers.llamahub_modules.github_repo.utils import (
-    BufferedGitBlobDataIterator,
+    compile_directories_pattern,
+    compile_file_extensions_pattern,
     get_file_extension,
-    print_if_verbose,
+    get_parent_directories,
 )
 from llama_index.readers.schema.base import Document
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# A blob tree object and the file's full path relative to the root of the repo.
+BlobAndPath = Tuple[GitTreeResponseModel.GitTreeObject, str]
+
 
 class GithubRepositoryReader(BaseReader):
     """
@@ -96,7 +111,8 @@ class GithubRepositoryReader(BaseReader):
                 containing a list of file extensions and a FilterType. If the
                 FilterType is INCLUDE, only the files with the extensions in the list
                 will be included. If the FilterType is EXCLUDE, the files with the
-                extensions in the list will be excluded.
+                extensions in the list will be excluded. Extensions are matched
+                case-insensitively, with or without the leading dot.
 
         Raises:
             - `ValueError`: If the github_token is not provided and
@@ -110,7 +126,31 @@ class GithubRepositoryReader(BaseReader):
         self._verbose = verbose
         self._concurrent_requests = concurrent_requests
         self._filter_directories = filter_directories
+        if filter_directories is not None:
+            # All the directories are checked at once by a single regex, and
+            # their parent directories by a single lookup.
+            self._filter_directories_pattern = compile_directories_pattern(
+                filter_directories[0]
+            )
+            self._filter_parent_directories = get_parent_directories(
+                filter_directories[0]
+            )
         self._filter_file_extensions = filter_file_extensions
+        if filter_file_extensions is not None:
+            # Match the format of get_file_extension, i.e. '.py' for 'py' or '.PY'.
+            self._filter_file_extensions_pattern = compile_file_extensions_pattern(
+                f".{extension.lower().lstrip('.')}"
+                for extension in filter_file_extensions[0]
+            )
+        # Whether a directory is allowed by the directory filter, by its path.
+        self._dir_filter_cache: Dict[str, bool] = {}
+        # Initialized parsers, by file extension. Documents are generated in
+        # a thread pool, hence the lock.
+        self._parser_pool: Dict[str, Any] = {}
+        self._parser_pool_lock = threading.Lock()
+        # Parsers are not known to be thread-safe, so each of them only
+        # parses one file at a time, by file extension.
+        self._parser_locks: Dict[str, threading.Lock] = {}
 
         # Set up the event loop
         try:
@@ -130,31 +170,38 @@ class GithubRepositoryReader(BaseReader):
 
         :return: True if the tree object should be allowed, False otherwise
         """
+        if self._filter_directories is None:
+            return True
+
+        if (allowed := self._dir_filter_cache.get(tree_obj_path)) is not None:
+            return allowed
+
         filter_directories, filter_type = self._filter_directories
-        print_if_verbose(
-            self._verbose,
-            f"Checking {tree_obj_path} whether to {filter_type} it"
-            + f" based on the filter directories: {filter_directories}",
-        )
+        if self._verbose:
+            print(
+                f"Checking {tree_obj_path} whether to {filter_type} it"
+                + f" based on the filter directories: {filter_directories}"
+            )
 
+        # The path matches if it starts with one of the directories,
+        # or if it is one of their parent directories.
+        matched = (
+            tree_obj_path in self._filter_parent_directories
+            or self._filter_directories_pattern.match(tree_obj_path) is not None
+        )
         if filter_type == self.FilterType.EXCLUDE:
-            return not any(
-                tree_obj_path.startswith(directory)
-                or directory.startswith(tree_obj_path)
-                for directory in filter_directories
-            )
+            allowed = not matched
         elif filter_type == self.FilterType.INCLUDE:
-            return any(
-                tree_obj_path.startswith(directory)
-                or directory.startswith(tree_obj_path)
-                for directory in filter_directories
-            )
+            allowed = matched
         else:
             raise ValueError(
                 f"Unknown filter type: {filter_type}. "
                 "Please use either 'ignore' or 'include'."
             )
 
+        self._dir_filter_cache[tree_obj_path] = allowed
+        return allowed
+
     def _check_filter_file_extensions(self, tree_obj_path: str) -> bool:
         """
         Check if a tree object should be allowed based on the file extensions.
@@ -163,17 +210,22 @@ class GithubRepositoryReader(BaseReader):
 
         :return: True if the tree object should be allowed, False otherwise
         """
+        if self._filter_file_extensions is None:
+            return True
+
         filter_file_extensions, filter_type = self._filter_file_extensions
-        print_if_verbose(
-            self._verbose,
-            f"Checking {tree_obj_path} whether to {filter_type} it"
-            + f" based on the filter file extensions: {filter_file_extensions}",
-        )
+        if self._verbose:
+            print(
+                f"Checking {tree_obj_path} whether to {filter_type} it"
+                + f" based on the filter file extensions: {filter_file_extensions}"
+            )
 
+        # Same as checking get_file_extension(tree_obj_path) in the extensions.
+        matched = self._filter_file_extensions_pattern.search(tree_obj_path)
         if filter_type == self.FilterType.EXCLUDE:
-            return get_file_extension(tree_obj_path) not in filter_file_extensions
+            return matched is None
         elif filter_type == self.FilterType.INCLUDE:
-            return get_file_extension(tree_obj_path) in filter_file_extensions
+            return matched is not None
         else:
             raise ValueError(
                 f"Unknown filter type: {filter_type}. "
@@ -197,280 +249,560 @@ class GithubRepositoryReader(BaseReader):
 
         return True
 
-    def _load_data_from_commit(self, commit_sha: str) -> List[Document]:
+    def load_data(
+        self,
+        commit_sha: Optional[str] = None,
+        branch: Optional[str] = None,
+    ) -> List[Document]:
         """
-        Load data from a commit.
+        Load data from a commit or a branch.
 
-        Loads github repository data from a specific commit sha.
+        Loads github repository data from a specific commit sha or a branch.
 
         :param `commit`: commit sha
+        :param `branch`: branch name
 
         :return: list of documents
         """
-        commit_response: GitCommitResponseModel = self._loop.run_until_complete(
-            self._github_client.get_commit(self._owner, self._repo, commit_sha)
-        )
-
-        tree_sha = commit_response.commit.tree.sha
-        blobs_and_paths = self._loop.run_until_complete(self._recurse_tree(tree_sha))
+        if commit_sha is not None and branch is not None:
+            raise ValueError("You can only specify one of commit or branch.")
 
-        print_if_verbose(self._verbose, f"got {len(blobs_and_paths)} blobs")
+        if commit_sha is None and branch is None:
+            raise ValueError("You must specify one of commit or branch.")
 
         return self._loop.run_until_complete(
-            self._generate_documents(blobs_and_paths=blobs_and_paths)
+            self._load_async(commit_sha=commit_sha, branch=branch)
         )
 
-    def _load_data_from_branch(self, branch: str) -> List[Document]:
+    async def _load_async(
+        self, *, commit_sha: Optional[str] = None, branch: Optional[str] = None
+    ) -> List[Document]:
         """
-        Load data from a branch.
+        Load data from a commit or a branch.
 
-        Loads github repository data from a specific branch.
+        The tree is walked while the blobs found so far are already being
+        fetched, instead of waiting for the whole tree first.
 
+        :param `commit`: commit sha
         :param `branch`: branch name
 
         :return: list of documents
         """
-        branch_data: GitBranchResponseModel = self._loop.run_until_complete(
-            self._github_client.get_branch(self._owner, self._repo, branch)
-        )
+        if commit_sha is not None:
+            commit_response: GitCommitResponseModel = (
+                await self._github_client.get_commit(
+                    self._owner, self._repo, commit_sha
+                )
+            )
+            tree_sha = commit_response.commit.tree.sha
+        elif branch is not None:
+            branch_data: GitBranchResponseModel = await self._github_client.get_branch(
+                self._owner, self._repo, branch
+            )
+            tree_sha = branch_data.commit.commit.tree.sha
+        else:
+            raise ValueError("You must specify one of commit or branch.")
 
-        tree_sha = branch_data.commit.commit.tree.sha
-        blobs_and_paths = self._loop.run_until_complete(self._recurse_tree(tree_sha))
+        # Allowed blobs as they are found, None once the whole tree is walked.
+        blob_queue: "asyncio.Queue[Optional[BlobAndPath]]" = asyncio.Queue()
 
-        print_if_verbose(self._verbose, f"got {len(blobs_and_paths)} blobs")
+        async def fetch_tree() -> None:
+            try:
+                await self._fetch_tree(tree_sha, blob_queue)
+            finally:
+                blob_queue.put_nowait(None)
 
-        return self._loop.run_until_complete(
-            self._generate_documents(blobs_and_paths=blobs_and_paths)
-        )
+        fetch_tree_task = asyncio.ensure_future(fetch_tree())
+        try:
+            documents = await self._generate_documents(blob_queue)
+            # Raise the error the tree fetch stopped on, if any.
+            await fetch_tree_task
+        finally:
+            fetch_tree_task.cancel()
+        return documents
 
-    def load_data(
+    async def _fetch_tree(
         self,
-        commit_sha: Optional[str] = None,
-        branch: Optional[str] = None,
-    ) -> List[Document]:
+        tree_sha: str,
+        blob_queue: "asyncio.Queue[Optional[BlobAndPath]]",
+    ) -> None:
         """
-        Load data from a commit or a branch.
-
-        Loads github repository data from a specific commit sha or a branch.
+        Get all blob tree objects in a tree with a single API request.
 
-        :param `commit`: commit sha
-        :param `branch`: branch name
+        Uses the recursive getTree endpoint and applies the filters to the
+        returned flat list. Falls back to `_walk_tree` if Github truncated
+        the response because the tree is too large.
 
-        :return: list of documents
+        :param `tree_sha`: sha of the tree
+        :param `blob_queue`: queue to put the tuples of
+            (tree object, file's full path realtive to the root of the repo) in
         """
-        if commit_sha is not None and branch is not None:
-            raise ValueError("You can only specify one of commit or branch.")
+        tree_data: GitTreeResponseModel = await self._github_client.get_tree_recursive(
+            self._owner, self._repo, tree_sha
+        )
+        if tree_data.truncated:
+            if self._verbose:
+                print(
+                    f"tree {tree_sha} is truncated - falling back to recursing into it"
+                )
+            await self._walk_tree(tree_sha, blob_queue)
+            return
 
-        if commit_sha is None and branch is None:
-            raise ValueError("You must specify one of commit or branch.")
+        for tree_obj in tree_data.tree:
+            if tree_obj.type != "blob":
+                continue
 
-        if commit_sha is not None:
-            return self._load_data_from_commit(commit_sha)
+            # Check every parent directory, as _walk_tree would have done
+            # while walking down to this blob.
+            parent_directories = tree_obj.path.split("/")[:-1]
+            if not all(
+                self._check_filter_directories("/".join(parent_directories[: i + 1]))
+                for i in range(len(parent_directories))
+            ):
+                if self._verbose:
+                    print(f"ignoring file {tree_obj.path} due to filter")
+                continue
 
-        if branch is not None:
-            return self._load_data_from_branch(branch)
+            if not self._check_filter_file_extensions(tree_obj.path):
+                if self._verbose:
+                    print(f"ignoring file {tree_obj.path} due to filter")
+                continue
 
-        raise ValueError("You must specify one of commit or branch.")
+            blob_queue.put_nowait((tree_obj, tree_obj.path))
 
-    async def _recurse_tree(
-        self, tree_sha: str, current_path: str = "", current_depth: int = 0
-    ) -> Any:
+    async def _walk_tree(
+        self,
+        root_tree_sha: str,
+        blob_queue: "asyncio.Queue[Optional[BlobAndPath]]",
+    ) -> None:
         """
-        Recursively get all blob tree objects in a tree.
+        Get all blob tree objects in a tree by walking down its subtrees.
 
         And construct their full path relative to the root of the repository.
         (see GitTreeResponseModel.GitTreeObject in
             github_api_client.py for more information)
+        The subtrees are fetched breadth first from a work queue by
+        `concurrent_requests` workers, which bounds the in-flight requests.
+
+        :param `root_tree_sha`: sha of the tree to walk
+        :param `blob_queue`: queue to put the tuples of
+            (tree object, file's full path realtive to the root of the repo) in
+        """
+        errors: List[Exception] = []
+        # Set on the first error, to stop the walk without sending the requests
+        # of the remaining subtrees (i.e. on a rate limit).
+        failed = asyncio.Event()
+        # (tree sha, path of the tree, depth of the tree)
+        queue: "asyncio.Queue[Tuple[str, str, int]]" = asyncio.Queue()
+        queue.put_nowait((root_tree_sha, "", 0))
+
+        async def worker() -> None:
+            while not failed.is_set():
+                tree_sha, current_path, current_depth = await queue.get()
+                try:
+                    await self._walk_subtree(
+                        tree_sha,
+                        current_path,
+                        current_depth,
+                        queue,
+                        blob_queue,
+                    )
+                except Exception as e:
+                    errors.append(e)
+                    failed.set()
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(self._concurrent_requests)
+        ]
+        walked = asyncio.ensure_future(queue.join())
+        stopped = asyncio.ensure_future(failed.wait())
+        try:
+            await asyncio.wait([walked, stopped], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Also cancels the requests still in flight after an error.
+            for task in (*workers, walked, stopped):
+                task.cancel()
+            await asyncio.gather(*workers, walked, stopped, return_exceptions=True)
+
+        if errors:
+            raise errors[0]
+
+    async def _walk_subtree(
+        self,
+        tree_sha: str,
+        current_path: str,
+        current_depth: int,
+        queue: "asyncio.Queue[Tuple[str, str, int]]",
+        blob_queue: "asyncio.Queue[Optional[BlobAndPath]]",
+    ) -> None:
+        """
+        Get the blob tree objects of a single tree, and queue its subtrees.
 
-        :param `tree_sha`: sha of the tree to recurse
+        :param `tree_sha`: sha of the tree
         :param `current_path`: current path of the tree
         :param `current_depth`: current depth of the tree
-        :return: list of tuples of
-            (tree object, file's full path realtive to the root of the repo)
+        :param `queue`: work queue of the subtrees left to walk
+        :param `blob_queue`: queue to put the found blobs in
         """
-        blobs_and_full_paths: List[Tuple[GitTreeResponseModel.GitTreeObject, str]] = []
-        print_if_verbose(
-            self._verbose, "\t" * current_depth + f"current path: {current_path}"
-        )
+        if self._verbose:
+            print("\t" * current_depth + f"current path: {current_path}")
 
         tree_data: GitTreeResponseModel = await self._github_client.get_tree(
             self._owner, self._repo, tree_sha
         )
-        print_if_verbose(
-            self._verbose, "\t" * current_depth + f"processing tree {tree_sha}"
-        )
+        if self._verbose:
+            print("\t" * current_depth + f"processing tree {tree_sha}")
         for tree_obj in tree_data.tree:
-            file_path = os.path.join(current_path, tree_obj.path)
+            # Github paths always use forward slashes, whatever the local OS.
+            file_path = (
+                f"{current_path}/{tree_obj.path}" if current_path else tree_obj.path
+            )
 
             if tree_obj.type == "tree":
-                print_if_verbose(
-                    self._verbose,
-                    "\t" * current_depth + f"recursing into {tree_obj.path}",
-                )
+                if self._verbose:
+                    print("\t" * current_depth + f"recursing into {tree_obj.path}")
                 if not self._check_filter_directories(file_path):
-                    print_if_verbose(
-                        self._verbose,
-                        "\t" * current_depth
-                        + f"ignoring directory {tree_obj.path} due to filter",
-                    )
+                    if self._verbose:
+                        print(
+                            "\t" * current_depth
+                            + f"ignoring directory {tree_obj.path} due to filter"
+                        )
                     continue
 
-                blobs_and_full_paths.extend(
-                    await self._recurse_tree(tree_obj.sha, file_path, current_depth + 1)
-                )
+                queue.put_nowait((tree_obj.sha, file_path, current_depth + 1))
             elif tree_obj.type == "blob":
-                print_if_verbose(
-                    self._verbose, "\t" * current_depth + f"found blob {tree_obj.path}"
-                )
+                if self._verbose:
+                    print("\t" * current_depth + f"found blob {tree_obj.path}")
                 if not self._check_filter_file_extensions(file_path):
-                    print_if_verbose(
-                        self._verbose,
-                        "\t" * current_depth
-                        + f"ignoring file {tree_obj.path} due to filter",
-                    )
+                    if self._verbose:
+                        print(
+                            "\t" * current_depth
+                            + f"ignoring file {tree_obj.path} due to filter"
+                        )
                     continue
 
-                blobs_and_full_paths.append((tree_obj, file_path))
-        return blobs_and_full_paths
+                blob_queue.put_nowait((tree_obj, file_path))
 
     async def _generate_documents(
-        self, blobs_and_paths: List[Tuple[GitTreeResponseModel.GitTreeObject, str]]
+        self,
+        blob_queue: "asyncio.Queue[Optional[BlobAndPath]]",
     ) -> List[Document]:
         """
-        Generate documents from a list of blobs and their full paths.
+        Generate documents from the blobs and their full paths, as they are found.
 
-        :param `blobs_and_paths`: list of tuples of
+        :param `blob_queue`: queue of tuples of
             (tree object, file's full path in the repo realtive to the root of the repo)
+            ended by None once the whole tree is walked
         :return: list of documents
         """
-        buffered_iterator = BufferedGitBlobDataIterator(
-            blobs_and_paths=blobs_and_paths,
-            github_client=self._github_client,
-            owner=self._owner,
-            repo=self._repo,
-            loop=self._loop,
-            buffer_size=self._concurrent_requests,  # TODO: make this configurable
-            verbose=self._verbose,
-        )
-
-        documents = []
-        async for blob_data, full_path in buffered_iterator:
-            print_if_verbose(self._verbose, f"generating document for {full_path}")
-            assert (
-                blob_data.encoding == "base64"
-            ), f"blob encoding {blob_data.encoding} not supported"
-            decoded_bytes = None
+        # Identical files share a sha, so fetch and decode each of them once
+        # and generate a document for every path they are found at.
+        sha_to_paths: DefaultDict[str, List[str]] = defaultdict(list)
+        tree_walked = asyncio.Event()
+        # Bounds the number of in-flight getBlob requests.
+        semaphore = asyncio.Semaphore(self._concurrent_requests)
+
+        # Decoding and parsing are CPU bound, so run them in a thread pool
+        # and let the event loop keep fetching the next blobs meanwhile.
+        # Each parser still parses one file at a time, see _parser_locks.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._concurrent_requests
+        ) as pool:
+            pending_documents: List[asyncio.Future] = []
             try:
-                decoded_bytes = base64.b64decode(blob_data.content)
-                del blob_data.content
-            except binascii.Error:
-                print_if_verbose(
-                    self._verbose, f"could not decode {full_path} as base64"
-                )
-                continue
+                while (blob_and_path := await blob_queue.get()) is not None:
+                    blob, full_path = blob_and_path
+                    if blob.sha not in sha_to_paths:
+                        pending_documents.append(
+                            asyncio.ensure_future(
+                                self._fetch_blob_documents(
+                                    blob,
+                                    sha_to_paths[blob.sha],
+                                    tree_walked,
+                                    semaphore,
+                                    pool,
+                                )
+                            )
+                        )
+                    sha_to_paths[blob.sha].append(full_path)
+                tree_walked.set()
 
-            if self._use_parser:
-                document = self._parse_supported_file(
-                    file_path=full_path,
-                    file_content=decoded_bytes,
-                    tree_sha=blob_data.sha,
-                    tree_path=full_path,
+                if self._verbose:
+                    print(
+                        f"got {sum(map(len, sha_to_paths.values()))} blobs"
+                        + f" ({len(sha_to_paths)} unique)"
+                    )
+
+                blob_documents: List[List[Document]] = await asyncio.gather(
+                    *pending_documents
                 )
-                if document is not None:
-                    documents.append(document)
-                    continue
-                print_if_verbose(
-                    self._verbose,
+            finally:
+                for pending in pending_documents:
+                    pending.cancel()
+
+        return [document for documents in blob_documents for document in documents]
+
+    async def _fetch_blob_documents(
+        self,
+        blob: GitTreeResponseModel.GitTreeObject,
+        full_paths: List[str],
+        tree_walked: asyncio.Event,
+        semaphore: asyncio.Semaphore,
+        pool: concurrent.futures.Executor,
+    ) -> List[Document]:
+        """
+        Fetch a blob and generate its documents.
+
+        :param `blob`: tree object of the blob
+        :param `full_paths`: file's full paths realtive to the root of the repo,
+            complete once `tree_walked` is set
+        :param `tree_walked`: event set once the whole tree is walked
+        :param `semaphore`: semaphore bounding the in-flight requests
+        :param `pool`: executor to decode and parse the blob in
+        :return: list of the documents of the blob, empty if it could not be decoded
+        """
+        # Generate the texts of the paths known so far right away, so that only
+        # the texts, and not the content of the blob, are kept until the walk
+        # ends. Binary files without a parser are dropped at this point.
+        texts = await self._fetch_blob_texts(blob, list(full_paths), semaphore, pool)
+        if texts is None:
+            return []
+
+        # The same blob can still be found at other paths until the walk ends.
+        # Those reuse the text generated for the same file type, and the blob
+        # is only fetched again for a file type it was not found with yet.
+        await tree_walked.wait()
+        new_paths = [p for p in full_paths if self._text_key(p) not in texts]
+        if new_paths:
+            texts.update(
+                await self._fetch_blob_texts(blob, new_paths, semaphore, pool) or {}
+            )
+
+        documents = []
+        for full_path in full_paths:
+            text = texts.get(self._text_key(full_path))
+            if text is not None:
+                documents.append(self._make_document(*text, blob.sha, full_path))
+        return documents
+
+    async def _fetch_blob_texts(
+        self,
+        blob: GitTreeResponseModel.GitTreeObject,
+        full_paths: List[str],
+        semaphore: asyncio.Semaphore,
+        pool: concurrent.futures.Executor,
+    ) -> Optional[Dict[Optional[str], Optional[Tuple[str, bool]]]]:
+        """
+        Fetch a blob and generate its texts for the file types of some paths.
+
+        :param `blob`: tree object of the blob
+        :param `full_paths`: file's full paths realtive to the root of the repo
+        :param `semaphore`: semaphore bounding the in-flight requests
+        :param `pool`: executor to decode and parse the blob in
+        :return: see `_generate_blob_texts`
+        """
+        async with semaphore:
+            blob_data: GitBlobResponseModel = await self._github_client.get_blob(
+                self._owner, self._repo, blob.sha
+            )
+        return await self._loop.run_in_executor(
+            pool, self._generate_blob_texts, blob_data, full_paths
+        )
+
+    def _text_key(self, full_path: str) -> Optional[str]:
+        """
+        Get the key of the text generated for a path.
+
+        The text of a blob only depends on the parser picked for the path,
+        i.e. on its file extension, or on nothing if no parser is used.
+        """
+        return get_file_extension(full_path) if self._use_parser else None
+
+    def _generate_blob_texts(
+        self, blob_data: GitBlobResponseModel, full_paths: List[str]
+    ) -> Optional[Dict[Optional[str], Optional[Tuple[str, bool]]]]:
+        """
+        Decode a blob and generate its text for the file types of some paths.
+
+        :param `blob_data`: blob data with its base64 encoded content
+        :param `full_paths`: file's full paths realtive to the root of the repo
+        :return: the texts as returned by `_generate_text`, by `_text_key`,
+            None if the blob could not be decoded
+        """
+        assert (
+            blob_data.encoding == "base64"
+        ), f"blob encoding {blob_data.encoding} not supported"
+        try:
+            # a2b_base64 skips the newlines Github wraps the content with.
+            decoded_bytes = binascii.a2b_base64(blob_data.content)
+        except binascii.Error:
+            if self._verbose:
+                print(f"could not decode {', '.join(full_paths)} as base64")
+            return None
+
+        texts: Dict[Optional[str], Optional[Tuple[str, bool]]] = {}
+        for full_path in full_paths:
+            if (key := self._text_key(full_path)) not in texts:
+                texts[key] = self._generate_text(decoded_bytes, full_path)
+        return texts
+
+    def _generate_text(
+        self, decoded_bytes: bytes, full_path: str
+    ) -> Optional[Tuple[str, bool]]:
+        """
+        Generate the text of a document from the decoded content of a blob.
+
+        :param `decoded_bytes`: content of the blob
+        :param `full_path`: file's full path realtive to the root of the repo
+        :return: the text and whether a parser extracted it,
+            None if the content could neither be parsed nor decoded
+        """
+        if self._verbose:
+            print(f"generating document for {full_path}")
+
+        if self._use_parser:
+            parsed_text = self._parse_supported_file(
+                file_path=full_path, file_content=decoded_bytes
+            )
+            if parsed_text is not None:
+                return parsed_text, True
+            if self._verbose:
+                print(
                     f"could not parse {full_path} as a supported file type"
-                    + " - falling back to decoding as utf-8 raw text",
+                    + " - falling back to decoding as utf-8 raw text"
                 )
 
-            try:
-                if decoded_bytes is None:
-                    raise ValueError("decoded_bytes is None")
-                decoded_text = decoded_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                print_if_verbose(
-                    self._verbose, f"could not decode {full_path} as utf-8"
-                )
-                continue
-            print_if_verbose(
-                self._verbose,
+        try:
+            decoded_text = decoded_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            if self._verbose:
+                print(f"could not decode {full_path} as utf-8")
+            return None
+        if self._verbose:
+            print(
                 f"got {len(decoded_text)} characters"
-                + f"- adding to documents - {full_path}",
+                + f"- adding to documents - {full_path}"
             )
-            document = Document(
-                text=decoded_text,
-                doc_id=blob_data.sha,
-                extra_info={
-                    "file_path": full_path,
-                    "file_name": full_path.split("/")[-1],
-                },
-            )
-            documents.append(document)
-        return documents
+        return decoded_text, False
+
+    def _make_document(
+        self, text: str, parsed: bool, blob_sha: str, full_path: str
+    ) -> Document:
+        """
+        Make the document of a path.
+
+        :param `text`: text of the document
+        :param `parsed`: whether a parser extracted the text
+        :param `blob_sha`: sha of the blob
+        :param `full_path`: file's full path realtive to the root of the repo
+        :return: the document
+        """
+        return Document(
+            text=text,
+            doc_id=blob_sha,
+            extra_info={
+                "file_path": full_path,
+                "file_name": full_path if parsed else full_path.rpartition("/")[2],
+            },
+        )
+
+    def _get_parser(self, file_extension: str) -> Optional[Any]:
+        """
+        Get an initialized parser for a file extension.
+
+        The parsers of DEFAULT_FILE_EXTRACTOR are shared by every reader in the
+        process, so each reader initializes instances of its own, on first use,
+        and reuses them for the following files.
+
+        :param `file_extension`: extension of the file, i.e. '.pdf'
+        :return: the parser if the extension is supported, None otherwise
+        """
+        parser = self._parser_pool.get(file_extension)
+        if parser is None:
+            with self._parser_pool_lock:
+                parser = self._parser_pool.get(file_extension)
+                if parser is None:
+                    default_parser = DEFAULT_FILE_EXTRACTOR.get(file_extension)
+                    if default_parser is None:
+                        return None
+                    parser = type(default_parser)()
+                    parser.init_parser()
+                    self._parser_locks[file_extension] = threading.Lock()
+                    self._parser_pool[file_extension] = parser
+        return parser
+
+    def close(self) -> None:
+        """Release the parsers initialized while loading data."""
+        for parser in self._parser_pool.values():
+            if callable(close := getattr(parser, "close", None)):
+                close()
+        self._parser_pool.clear()
+        self._parser_locks.clear()
 
     def _parse_supported_file(
-        self, file_path: str, file_content: bytes, tree_sha: str, tree_path: str
-    ) -> Optional[Document]:
+        self, file_path: str, file_content: bytes
+    ) -> Optional[str]:
         """
         Parse a file if it is supported by a parser.
 
         :param `file_path`: path of the file in the repo
         :param `file_content`: content of the file
-        :return: Document if the file is supported by a parser, None otherwise
+        :return: text of the file if it is supported by a parser, None otherwise
         """
         file_extension = get_file_extension(file_path)
-        if (parser := DEFAULT_FILE_EXTRACTOR.get(file_extension)) is not None:
-            parser.init_parser()
-            print_if_verbose(
-                self._verbose,
-                f"parsing {file_path}"
-                + f"as {file_extension} with "
-                + f"{parser.__class__.__name__}",
-            )
-            with tempfile.TemporaryDirectory() as tmpdirname:
-                with tempfile.NamedTemporaryFile(
-                    dir=tmpdirname,
-                    suffix=f".{file_extension}",
-                    mode="w+b",
-                    delete=False,
-                ) as tmpfile:
-                    print_if_verbose(
-                        self._verbose,
-                        "created a temporary file"
-                        + f"{tmpfile.name} for parsing {file_path}",
-                    )
-                    tmpfile.write(file_content)
-                    tmpfile.flush()
-                    tmpfile.close()
-                    try:
-                        parsed_file = parser.parse_file(pathlib.Path(tmpfile.name))
-                        parsed_file = "\n\n".join(parsed_file)
-                    except Exception as e:
-                        print_if_verbose(
-                            self._verbose, f"error while parsing {file_path}"
-                        )
-                        logger.error(
-                            "Error while parsing "
-                            + f"{file_path} with "
-                            + f"{parser.__class__.__name__}:\n{e}"
-                        )
-                        parsed_file = None
-                    finally:
-                        os.remove(tmpfile.name)
-                    if parsed_file is None:
-                        return None
-                    return Document(
-                        text=parsed_file,
-                        doc_id=tree_sha,
-                        extra_info={
-                            "file_path": file_path,
-                            "file_name": tree_path,
-                        },
+        if (parser := self._get_parser(file_extension)) is not None:
+            if self._verbose:
+                print(
+                    f"parsing {file_path}"
+                    + f"as {file_extension} with "
+                    + f"{parser.__class__.__name__}"
+                )
+            try:
+                with self._parser_locks[file_extension]:
+                    parsed_file = self._parse_file_from_tempfile(
+                        parser, file_path, file_content, file_extension
                     )
+                return "\n\n".join(parsed_file)
+            except Exception as e:
+                if self._verbose:
+                    print(f"error while parsing {file_path}")
+                logger.error(
+                    "Error while parsing "
+                    + f"{file_path} with "
+                    + f"{parser.__class__.__name__}:\n{e}"
+                )
         return None
 
+    def _parse_file_from_tempfile(
+        self, parser: Any, file_path: str, file_content: bytes, file_extension: str
+    ) -> Any:
+        """
+        Parse a file with a parser, from a temporary copy of it on disk.
+
+        :param `parser`: parser to use
+        :param `file_path`: path of the file in the repo
+        :param `file_content`: content of the file
+        :param `file_extension`: extension of the file, i.e. '.pdf'
+        :return: the parsed file as returned by the parser
+        """
+        with tempfile.NamedTemporaryFile(
+            suffix=file_extension,
+            mode="w+b",
+            delete=False,
+        ) as tmpfile:
+            if self._verbose:
+                print(
+                    "created a temporary file"
+                    + f"{tmpfile.name} for parsing {file_path}"
+                )
+            tmpfile.write(file_content)
+        try:
+            return parser.parse_file(pathlib.Path(tmpfile.name))
+        finally:
+            os.remove(tmpfile.name)
+
 
 if __name__ == "__main__":
     import time
@@ -164,6 +164,14 @@ class BaseGithubClient(Protocol):
     ) -> GitTreeResponseModel:
         ...
 
+    async def get_tree_recursive(
+        self,
+        owner: str,
+        repo: str,
+        tree_sha: str,
+    ) -> GitTreeResponseModel:
+        ...
+
     async def get_blob(
         self,
         owner: str,
@@ -243,6 +251,9 @@ class GithubClient:
 
         self._endpoints = {
             "getTree": "/repos/{owner}/{repo}/git/trees/{tree_sha}",
+            "getTreeRecursive": (
+                "/repos/{owner}/{repo}/git/trees/{tree_sha}?recursive=1"
+            ),
             "getBranch": "/repos/{owner}/{repo}/branches/{branch}",
             "getBlob": "/repos/{owner}/{repo}/git/blobs/{file_sha}",
             "getCommit": "/repos/{owner}/{repo}/commits/{commit_sha}",
@@ -362,6 +373,40 @@ class GithubClient:
             ).text
         )
 
+    async def get_tree_recursive(
+        self, owner: str, repo: str, tree_sha: str
+    ) -> GitTreeResponseModel:
+        """
+        Get information about a tree and all of its subtrees at once.
+
+        (Github API endpoint: getTree with recursive=1).
+        Paths of the returned objects are relative to the given tree.
+        Github truncates the response for very large trees,
+        see `GitTreeResponseModel.truncated`.
+
+        Args:
+            - `owner (str)`: Owner of the repository.
+            - `repo (str)`: Name of the repository.
+            - `tree_sha (str)`: SHA of the tree.
+
+        Returns:
+            - `tree_info (GitTreeResponseModel)`: Information about the tree.
+
+        Examples:
+            >>> tree_info = client.get_tree_recursive("owner", "repo", "tree_sha")
+        """
+        return GitTreeResponseModel.from_json(
+            (
+                await self.request(
+                    "getTreeRecursive",
+                    "GET",
+                    owner=owner,
+                    repo=repo,
+                    tree_sha=tree_sha,
+                )
+            ).text
+        )
+
     async def get_blob(
         self, owner: str, repo: str, file_sha: str
     ) -> GitBlobResponseModel:
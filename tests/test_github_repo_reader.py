@@ -0,0 +1,258 @@
+"""Test the Github repository reader against a fake Github client."""
+import asyncio
+import base64
+import hashlib
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from loader_hub.github_repo import GithubRepositoryReader
+from loader_hub.github_repo.github_client import (
+    GitBlobResponseModel,
+    GitBranchResponseModel,
+    GitTreeResponseModel,
+)
+
+# Path of each file in the fake repository, and its content.
+FILES = {
+    "README.md": "readme",
+    "docs/index.md": "index",
+    "docs/api/reference.md": "reference",
+    "docs2/notes.md": "notes",
+    "src/main.py": "main",
+    "src/copy_of_main.py": "main",
+    "src/img/logo.png": "png",
+}
+
+
+def _blob_sha(content: str) -> str:
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def _tree_sha(path: str) -> str:
+    return hashlib.sha1(f"tree:{path}".encode()).hexdigest()
+
+
+def _tree_obj(path: str, type: str, sha: str) -> GitTreeResponseModel.GitTreeObject:
+    return GitTreeResponseModel.GitTreeObject(
+        path=path, mode="100644", type=type, sha=sha, url=""
+    )
+
+
+def _directories() -> List[str]:
+    directories = {""}
+    for path in FILES:
+        parts = path.split("/")[:-1]
+        directories.update("/".join(parts[: i + 1]) for i in range(len(parts)))
+    return sorted(directories)
+
+
+def _get_tree(owner: str, repo: str, tree_sha: str) -> GitTreeResponseModel:
+    """Get the objects directly in a tree, with paths relative to it."""
+    (directory,) = [d for d in _directories() if _tree_sha(d) == tree_sha]
+    prefix = f"{directory}/" if directory else ""
+    tree = [
+        _tree_obj(d[len(prefix) :], "tree", _tree_sha(d))
+        for d in _directories()
+        if d.startswith(prefix) and d != directory and "/" not in d[len(prefix) :]
+    ] + [
+        _tree_obj(path[len(prefix) :], "blob", _blob_sha(content))
+        for path, content in FILES.items()
+        if path.startswith(prefix) and "/" not in path[len(prefix) :]
+    ]
+    return GitTreeResponseModel(sha=tree_sha, url="", tree=tree, truncated=False)
+
+
+def _get_tree_recursive(truncated: bool):
+    def get_tree_recursive(
+        owner: str, repo: str, tree_sha: str
+    ) -> GitTreeResponseModel:
+        tree = [_tree_obj(d, "tree", _tree_sha(d)) for d in _directories() if d] + [
+            _tree_obj(path, "blob", _blob_sha(content))
+            for path, content in FILES.items()
+        ]
+        return GitTreeResponseModel(
+            sha=tree_sha, url="", tree=tree, truncated=truncated
+        )
+
+    return get_tree_recursive
+
+
+def _get_blob(owner: str, repo: str, file_sha: str) -> GitBlobResponseModel:
+    (content,) = {c for c in FILES.values() if _blob_sha(c) == file_sha}
+    return GitBlobResponseModel(
+        content=base64.encodebytes(content.encode()).decode(),
+        encoding="base64",
+        url="",
+        sha=file_sha,
+        size=len(content),
+        node_id="",
+    )
+
+
+def _github_client(truncated: bool = False) -> MagicMock:
+    github_client = MagicMock()
+    github_client.get_branch = AsyncMock(
+        return_value=GitBranchResponseModel.from_dict(
+            {"commit": {"commit": {"tree": {"sha": _tree_sha("")}}}}
+        )
+    )
+    github_client.get_tree = AsyncMock(side_effect=_get_tree)
+    github_client.get_tree_recursive = AsyncMock(
+        side_effect=_get_tree_recursive(truncated)
+    )
+    github_client.get_blob = AsyncMock(side_effect=_get_blob)
+    return github_client
+
+
+def _load(
+    github_client: MagicMock, use_parser: bool = False, **kwargs
+) -> Dict[str, str]:
+    reader = GithubRepositoryReader(
+        github_client, "owner", "repo", use_parser=use_parser, **kwargs
+    )
+    documents = reader.load_data(branch="main")
+    assert len(documents) == len({d.extra_info["file_path"] for d in documents})
+    for document in documents:
+        file_path = document.extra_info["file_path"]
+        assert document.doc_id == _blob_sha(FILES[file_path])
+        assert document.extra_info["file_name"] == file_path.rpartition("/")[2]
+    return {d.extra_info["file_path"]: d.text for d in documents}
+
+
+@pytest.mark.parametrize("truncated", [False, True])
+def test_load_all_files(truncated: bool) -> None:
+    github_client = _github_client(truncated)
+    assert _load(github_client) == FILES
+
+    # The whole tree comes from one request, unless it is truncated.
+    github_client.get_tree_recursive.assert_awaited_once()
+    if truncated:
+        assert github_client.get_tree.await_count == len(_directories())
+    else:
+        github_client.get_tree.assert_not_awaited()
+
+
+@pytest.mark.parametrize("truncated", [False, True])
+def test_load_duplicate_blobs_once(truncated: bool) -> None:
+    github_client = _github_client(truncated)
+    _load(github_client)
+
+    fetched_shas = [call.args[2] for call in github_client.get_blob.await_args_list]
+    assert sorted(fetched_shas) == sorted({_blob_sha(c) for c in FILES.values()})
+
+
+@pytest.mark.parametrize("truncated", [False, True])
+def test_filter_directories_include(truncated: bool) -> None:
+    documents = _load(
+        _github_client(truncated),
+        filter_directories=(
+            ["docs/api", "src"],
+            GithubRepositoryReader.FilterType.INCLUDE,
+        ),
+    )
+    # Files at the root, and directly in the parents of the included
+    # directories, are not filtered out.
+    assert sorted(documents) == [
+        "README.md",
+        "docs/api/reference.md",
+        "docs/index.md",
+        "src/copy_of_main.py",
+        "src/img/logo.png",
+        "src/main.py",
+    ]
+
+
+@pytest.mark.parametrize("truncated", [False, True])
+def test_filter_directories_exclude(truncated: bool) -> None:
+    documents = _load(
+        _github_client(truncated),
+        filter_directories=(["docs"], GithubRepositoryReader.FilterType.EXCLUDE),
+    )
+    # docs also excludes docs2, as the directories are matched as path prefixes.
+    assert sorted(documents) == [
+        "README.md",
+        "src/copy_of_main.py",
+        "src/img/logo.png",
+        "src/main.py",
+    ]
+
+
+@pytest.mark.parametrize("truncated", [False, True])
+def test_filter_file_extensions(truncated: bool) -> None:
+    documents = _load(
+        _github_client(truncated),
+        filter_file_extensions=(
+            ["PNG", ".md"],
+            GithubRepositoryReader.FilterType.EXCLUDE,
+        ),
+    )
+    assert sorted(documents) == ["src/copy_of_main.py", "src/main.py"]
+
+    documents = _load(
+        _github_client(truncated),
+        filter_file_extensions=(["md"], GithubRepositoryReader.FilterType.INCLUDE),
+    )
+    assert sorted(documents) == [
+        "README.md",
+        "docs/api/reference.md",
+        "docs/index.md",
+        "docs2/notes.md",
+    ]
+
+
+def test_get_tree_error() -> None:
+    def get_tree(owner: str, repo: str, tree_sha: str) -> GitTreeResponseModel:
+        if tree_sha != _tree_sha(""):
+            raise RuntimeError("rate limited")
+        return _get_tree(owner, repo, tree_sha)
+
+    github_client = _github_client(truncated=True)
+    github_client.get_tree.side_effect = get_tree
+    with pytest.raises(RuntimeError, match="rate limited"):
+        _load(github_client, concurrent_requests=1)
+
+    # The walk stops on the first error, without requesting the other subtrees.
+    assert github_client.get_tree.await_count == 2
+
+
+@pytest.mark.parametrize("truncated", [False, True])
+def test_get_blob_error(truncated: bool) -> None:
+    github_client = _github_client(truncated)
+    github_client.get_blob.side_effect = RuntimeError("not found")
+    with pytest.raises(RuntimeError, match="not found"):
+        _load(github_client)
+
+
+def test_load_duplicate_blobs_found_later(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(FILES, "notes.txt", "notes")
+    monkeypatch.setitem(FILES, "docs/api/notes.txt", "notes")
+    monkeypatch.setitem(FILES, "docs/api/notes.rst", "notes")
+
+    async def get_tree(owner: str, repo: str, tree_sha: str) -> GitTreeResponseModel:
+        # Only list the subtrees once the blobs at the root are being fetched.
+        while tree_sha != _tree_sha("") and not github_client.get_blob.await_count:
+            await asyncio.sleep(0)
+        return _get_tree(owner, repo, tree_sha)
+
+    github_client = _github_client(truncated=True)
+    github_client.get_tree.side_effect = get_tree
+    documents = _load(
+        github_client,
+        use_parser=True,
+        filter_file_extensions=(
+            [".txt", ".rst"],
+            GithubRepositoryReader.FilterType.INCLUDE,
+        ),
+    )
+    assert documents == {
+        "notes.txt": "notes",
+        "docs/api/notes.txt": "notes",
+        "docs/api/notes.rst": "notes",
+    }
+
+    # The text of notes.txt is reused for docs/api/notes.txt, but the blob is
+    # fetched again for the file type of docs/api/notes.rst.
+    fetched_shas = [call.args[2] for call in github_client.get_blob.await_args_list]
+    assert fetched_shas == [_blob_sha("notes")] * 2
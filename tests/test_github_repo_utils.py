@@ -0,0 +1,85 @@
+"""Test the path filter regexes of the Github repository reader."""
+from typing import List
+
+import pytest
+
+from loader_hub.github_repo.utils import (
+    compile_directories_pattern,
+    compile_file_extensions_pattern,
+    get_file_extension,
+    get_parent_directories,
+)
+
+PATHS = [
+    "",
+    "README",
+    "README.md",
+    "readme.MD",
+    ".bashrc",
+    "..bashrc",
+    ".bashrc.bak",
+    "file.",
+    "file..",
+    "a.tar.GZ",
+    "a.tar.gz",
+    "docs",
+    "docs2",
+    "docs/",
+    "docs/index.md",
+    "docs2/index.md",
+    "doc",
+    "dir.d/file",
+    "dir.d/.config",
+    "dir/.md",
+    "src/main.py",
+    "src/main.py.orig",
+    "src/pkg",
+    "src/pkg/__init__.py",
+    "a+b/(c)/[d].txt",
+]
+
+
+@pytest.mark.parametrize(
+    "file_extensions",
+    [
+        [],
+        [".md"],
+        [".py", ".gz"],
+        ["."],
+        [".", ".md"],
+        [".bashrc"],
+        [".tar.gz"],
+        [".d/file"],
+        [".txt", ".bak", ".orig"],
+    ],
+)
+def test_file_extensions_pattern(file_extensions: List[str]) -> None:
+    pattern = compile_file_extensions_pattern(file_extensions)
+    for path in PATHS:
+        assert (pattern.search(path) is not None) == (
+            get_file_extension(path) in file_extensions
+        ), path
+
+
+@pytest.mark.parametrize(
+    "directories",
+    [
+        [],
+        [""],
+        ["docs"],
+        ["docs2"],
+        ["docs/"],
+        ["docs", "src/pkg"],
+        ["a+b/(c)"],
+        ["dir.d", "src"],
+        ["x" * 1000],
+    ],
+)
+def test_directories_pattern(directories: List[str]) -> None:
+    pattern = compile_directories_pattern(directories)
+    parent_directories = get_parent_directories(directories)
+    for path in PATHS + directories:
+        assert (path in parent_directories or pattern.match(path) is not None) == any(
+            path.startswith(directory) or directory.startswith(path)
+            for directory in directories
+        ), path
@@ -27,6 +27,12 @@ def test_library_matches() -> None:
         readme_file = entry_dir / "README.md"
         assert readme_file.exists()
 
+        # make sure the extra files exist, next to the loader file as
+        # download_loader only creates the loader directory
+        for extra_file in entry.get("extra_files", []):
+            assert "/" not in extra_file
+            assert (entry_dir / extra_file).exists()
+
         spec = util.spec_from_file_location("custom_loader", location=str(entry_file))
         if spec is None:
             raise ValueError(f"Could not find file: {str(entry_file)}.")
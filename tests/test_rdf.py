@@ -0,0 +1,97 @@
+"""Test the RDF reader."""
+from pathlib import Path
+
+import pytest
+
+from loader_hub.file.rdf.base import RDFReader
+
+TURTLE = """\
+@prefix ex: <http://example.org/> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+ex:alice rdfs:label "Alicia", "Alice"@en, "Alix"@fr ;
+    a ex:Person ;
+    ex:knows ex:bob .
+ex:bob rdfs:label "Bob" ;
+    a ex:Person .
+ex:Person rdfs:label "Person"@en, "Personne"@fr .
+ex:knows rdfs:label "knows" .
+"""
+
+
+@pytest.fixture
+def turtle_file(tmp_path: Path) -> Path:
+    path = tmp_path / "graph.ttl"
+    path.write_text(TURTLE)
+    return path
+
+
+def test_labels(turtle_file: Path) -> None:
+    # Tagged labels beat untagged ones, and the labels of the RDF
+    # vocabulary (rdf:type) come from the bundled global graph.
+    assert RDFReader().load_data(turtle_file)[0].text.split("\n") == [
+        "<Alice> <knows> <Bob>",
+        "<Alice> <type> <Person>",
+        "<Bob> <type> <Person>",
+    ]
+
+
+def test_local_labels_over_global(tmp_path: Path) -> None:
+    path = tmp_path / "graph.ttl"
+    path.write_text(TURTLE + 'rdf:type rdfs:label "is a"@en .\n')
+    assert RDFReader().load_data(path)[0].text.split("\n") == [
+        "<Alice> <knows> <Bob>",
+        "<Alice> <is a> <Person>",
+        "<Bob> <is a> <Person>",
+    ]
+
+
+def test_lang(turtle_file: Path) -> None:
+    text = RDFReader().load_data(turtle_file, extra_info={"lang": "fr"})[0].text
+    assert text.split("\n") == [
+        "<Alix> <knows> <Bob>",
+        "<Alix> <type> <Personne>",
+        "<Bob> <type> <Personne>",
+    ]
+
+    # Without a label in the language, the untagged label is used.
+    triples = RDFReader().iter_triples(turtle_file, extra_info={"lang": "de"})
+    assert next(triples) == "<Alicia> <knows> <Bob>"
+
+    # ex:Person has no untagged label.
+    with pytest.raises(Exception, match="Label not found"):
+        RDFReader().load_data(turtle_file, extra_info={"lang": "de"})
+
+
+def test_format(turtle_file: Path, tmp_path: Path) -> None:
+    expected = RDFReader().load_data(turtle_file)[0].text
+
+    # The extension does not tell the format of the file.
+    path = tmp_path / "graph.txt"
+    path.write_text(TURTLE)
+    assert RDFReader().load_data(path, format="turtle")[0].text == expected
+    assert (
+        RDFReader().load_data(path, extra_info={"format": "turtle"})[0].text == expected
+    )
+
+
+def test_iter_triples(turtle_file: Path, tmp_path: Path) -> None:
+    reader = RDFReader()
+    assert list(reader.iter_triples(turtle_file)) == (
+        reader.load_data(turtle_file)[0].text.split("\n")
+    )
+
+    # Generators of the same reader do not share their labels.
+    other_file = tmp_path / "other.ttl"
+    other_file.write_text(
+        "@prefix ex: <http://example.org/other/> .\n"
+        "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+        'ex:carol rdfs:label "Carol" ; ex:knows ex:dave .\n'
+        'ex:dave rdfs:label "Dave" .\n'
+        'ex:knows rdfs:label "knows" .\n'
+    )
+    triples = reader.iter_triples(turtle_file)
+    first_triple = next(triples)
+    assert list(reader.iter_triples(other_file)) == ["<Carol> <knows> <Dave>"]
+    assert [first_triple, *triples] == list(reader.iter_triples(turtle_file))